@@ -12,52 +12,65 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
-import json
+import functools
 import os
 import pathlib
 
-import boto3
 import pytest
 import tests.integ
 
-from botocore.config import Config
 from packaging.version import Version
 
 from sagemaker import Session, image_uris, utils, get_execution_role
-from sagemaker.local import LocalSession
-from sagemaker.workflow.pipeline_context import PipelineSession, LocalPipelineSession
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 DEFAULT_REGION = "us-west-2"
 CUSTOM_BUCKET_NAME_PREFIX = "sagemaker-custom-bucket"
 CUSTOM_S3_OBJECT_KEY_PREFIX = "session-default-prefix"
 
-NO_M4_REGIONS = [
-    "eu-west-3",
-    "eu-north-1",
-    "ap-east-1",
-    "ap-northeast-1",  # it has m4.xl, but not enough in all AZs
-    "sa-east-1",
-    "me-south-1",
-]
-
-NO_P3_REGIONS = [
-    "af-south-1",
-    "ap-east-1",
-    "ap-southeast-1",  # it has p3, but not enough
-    "ap-southeast-2",  # it has p3, but not enough
-    "ca-central-1",  # it has p3, but not enough
-    "eu-central-1",  # it has p3, but not enough
-    "eu-north-1",
-    "eu-west-2",  # it has p3, but not enough
-    "eu-west-3",
-    "eu-south-1",
-    "me-south-1",
-    "sa-east-1",
-    "us-west-1",
-    "ap-south-1",  # no p3 availability
-]
-
-NO_T2_REGIONS = ["eu-north-1", "ap-east-1", "me-south-1"]
+NO_M4_REGIONS = frozenset(
+    {
+        "eu-west-3",
+        "eu-north-1",
+        "ap-east-1",
+        "ap-northeast-1",  # it has m4.xl, but not enough in all AZs
+        "sa-east-1",
+        "me-south-1",
+    }
+)
+
+NO_P3_REGIONS = frozenset(
+    {
+        "af-south-1",
+        "ap-east-1",
+        "ap-southeast-1",  # it has p3, but not enough
+        "ap-southeast-2",  # it has p3, but not enough
+        "ca-central-1",  # it has p3, but not enough
+        "eu-central-1",  # it has p3, but not enough
+        "eu-north-1",
+        "eu-west-2",  # it has p3, but not enough
+        "eu-west-3",
+        "eu-south-1",
+        "me-south-1",
+        "sa-east-1",
+        "us-west-1",
+        "ap-south-1",  # no p3 availability
+    }
+)
+
+NO_T2_REGIONS = frozenset({"eu-north-1", "ap-east-1", "me-south-1"})
+
+# Regions where p2/p3 instances are unavailable for hosting or training
+_NO_P2 = frozenset(tests.integ.HOSTING_NO_P2_REGIONS + tests.integ.TRAINING_NO_P2_REGIONS)
+_NO_P3 = frozenset(tests.integ.HOSTING_NO_P3_REGIONS + tests.integ.TRAINING_NO_P3_REGIONS)
+
+# (instance type, instance family, EC2 instance type) for the default CPU instance
+_M5 = ("ml.m5.xlarge", "ml_m5", "m5.xlarge")
+_M4 = ("ml.m4.xlarge", "ml_m4", "m4.xlarge")
 
 FRAMEWORKS_FOR_GENERATED_VERSION_FIXTURES = (
     "chainer",
@@ -86,6 +99,16 @@ FRAMEWORKS_FOR_GENERATED_VERSION_FIXTURES = (
 
 PYTORCH_RENEWED_GPU = "ml.g4dn.xlarge"
 
+CHAINER_PY_VERSIONS = ("py2", "py3")
+PYTORCH_DDP_FRAMEWORK_VERSIONS = ("1.10", "1.10.0", "1.10.2", "1.11", "1.11.0", "1.12", "1.12.0")
+TORCH_DISTRIBUTED_FRAMEWORK_VERSIONS = ("1.11.0",)
+
+_STS_CLIENTS = {}
+_sts_endpoint = functools.lru_cache(maxsize=16)(utils.sts_regional_endpoint)
+_SM_CLIENTS = {}
+_SMR_CLIENTS = {}
+_HTTP_SESSIONS = {}
+
 
 image_uris_unit_tests_dir = pathlib.Path("tests/unit/sagemaker/image_uris")
 
@@ -105,38 +128,85 @@ def pytest_addoption(parser):
 
 
 def pytest_configure(config):
-    bc = config.getoption("--boto-config")
-    parsed = json.loads(bc) if bc else {}
-    region = parsed.get("region_name", boto3.session.Session().region_name)
-    if region:
-        os.environ["TEST_AWS_REGION_NAME"] = region
+    config._boto_parsed = _parse_json_option(config, "--boto-config")
+    config._sagemaker_client_parsed = _parse_json_option(config, "--sagemaker-client-config")
+    config._sagemaker_runtime_parsed = _parse_json_option(config, "--sagemaker-runtime-config")
+    config._sagemaker_metrics_parsed = _parse_json_option(config, "--sagemaker-metrics-config")
+
+    config._test_region = _make_boto_session(**_boto_session_kwargs(config)).region_name
+    if not config._test_region:
+        config._test_region = DEFAULT_REGION
+    os.environ["TEST_AWS_REGION_NAME"] = config._test_region
+
+
+def _parse_json_option(config, name):
+    value = config.getoption(name)
+    return _json.loads(value) if value else {}
 
 
 @pytest.fixture(scope="session")
 def sagemaker_client_config(request):
-    config = request.config.getoption("--sagemaker-client-config")
-    return json.loads(config) if config else dict()
+    return dict(request.config._sagemaker_client_parsed)
 
 
 @pytest.fixture(scope="session")
 def sagemaker_runtime_config(request):
-    config = request.config.getoption("--sagemaker-runtime-config")
-    return json.loads(config) if config else None
+    config = request.config._sagemaker_runtime_parsed
+    return dict(config) if config else None
 
 
 @pytest.fixture(scope="session")
 def sagemaker_metrics_config(request):
-    config = request.config.getoption("--sagemaker-metrics-config")
-    return json.loads(config) if config else None
+    config = request.config._sagemaker_metrics_parsed
+    return dict(config) if config else None
 
 
 @pytest.fixture(scope="session")
 def boto_session(request):
-    config = request.config.getoption("--boto-config")
-    if config:
-        return boto3.Session(**json.loads(config))
-    else:
-        return boto3.Session(region_name=DEFAULT_REGION)
+    return _make_boto_session(**_boto_session_kwargs(request.config))
+
+
+def _boto_session_kwargs(config):
+    return config._boto_parsed or {"region_name": DEFAULT_REGION}
+
+
+@functools.lru_cache(maxsize=None)
+def _make_boto_session(**config):
+    # A bare botocore session is not enough: sagemaker.Session builds an S3 resource on init.
+    import boto3
+
+    session = boto3.Session(**config)
+    session.events.register("creating-client-class", _share_http_session)
+    return session
+
+
+def _share_http_session(base_classes, **kwargs):
+    base_classes.insert(0, _SharedHTTPSessionClient)
+
+
+class _SharedHTTPSessionClient(object):
+    """Client mixin that reuses one HTTP session per distinct transport configuration.
+
+    Every session fixture (Session, LocalSession, PipelineSession, ...) builds its own
+    sagemaker, sagemaker-runtime and s3 clients against the same endpoints, so sharing the
+    underlying urllib3 pools lets them reuse already established connections.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_SharedHTTPSessionClient, self).__init__(*args, **kwargs)
+        config = self.meta.config
+        http_session = self._endpoint.http_session
+        key = (
+            config.connect_timeout,
+            config.read_timeout,
+            config.max_pool_connections,
+            config.tcp_keepalive,
+            repr(config.proxies),
+            repr(config.proxies_config),
+            repr(config.client_cert),
+            repr(getattr(http_session, "_verify", None)),
+        )
+        self._endpoint.http_session = _HTTP_SESSIONS.setdefault(key, http_session)
 
 
 @pytest.fixture(scope="session")
@@ -151,18 +221,14 @@ def region(boto_session):
 
 @pytest.fixture(scope="session")
 def sagemaker_session(
-    sagemaker_client_config, sagemaker_runtime_config, boto_session, sagemaker_metrics_config
+    sagemaker_client_config, sagemaker_runtime_client, boto_session, sagemaker_metrics_config
 ):
-    sagemaker_client_config.setdefault("config", Config(retries=dict(max_attempts=10)))
-    sagemaker_client = (
-        boto_session.client("sagemaker", **sagemaker_client_config)
-        if sagemaker_client_config
-        else None
-    )
-    runtime_client = (
-        boto_session.client("sagemaker-runtime", **sagemaker_runtime_config)
-        if sagemaker_runtime_config
-        else None
+    sagemaker_client = _cached_client(
+        _SM_CLIENTS,
+        boto_session,
+        "sagemaker",
+        sagemaker_client_config,
+        retries=dict(max_attempts=10),
     )
     metrics_client = (
         boto_session.client("sagemaker-metrics", **sagemaker_metrics_config)
@@ -173,25 +239,53 @@ def sagemaker_session(
     return Session(
         boto_session=boto_session,
         sagemaker_client=sagemaker_client,
-        sagemaker_runtime_client=runtime_client,
+        sagemaker_runtime_client=sagemaker_runtime_client,
         sagemaker_metrics_client=metrics_client,
         sagemaker_config={},
         default_bucket_prefix=CUSTOM_S3_OBJECT_KEY_PREFIX,
     )
 
 
+@pytest.fixture(scope="session")
+def sagemaker_runtime_client(sagemaker_runtime_config, boto_session):
+    return (
+        _cached_client(_SMR_CLIENTS, boto_session, "sagemaker-runtime", sagemaker_runtime_config)
+        if sagemaker_runtime_config
+        else None
+    )
+
+
+def _cached_client(cache, boto_session, service_name, client_config, **default_config):
+    key = (boto_session.region_name, frozenset(client_config.items()))
+    if key not in cache:
+        from botocore.config import Config
+
+        client_config = dict(client_config)
+        client_config.setdefault(
+            "config", Config(max_pool_connections=50, tcp_keepalive=True, **default_config)
+        )
+        cache[key] = boto_session.client(service_name, **client_config)
+    return cache[key]
+
+
 @pytest.fixture(scope="session")
 def sagemaker_local_session(boto_session):
+    from sagemaker.local import LocalSession
+
     return LocalSession(boto_session=boto_session)
 
 
 @pytest.fixture(scope="session")
 def pipeline_session(boto_session):
+    from sagemaker.workflow.pipeline_context import PipelineSession
+
     return PipelineSession(boto_session=boto_session)
 
 
 @pytest.fixture(scope="session")
 def local_pipeline_session(boto_session):
+    from sagemaker.workflow.pipeline_context import LocalPipelineSession
+
     return LocalPipelineSession(boto_session=boto_session)
 
 
@@ -200,21 +294,27 @@ def execution_role(sagemaker_session):
     return get_execution_role(sagemaker_session)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def custom_bucket_name(boto_session):
     region = boto_session.region_name
-    account = boto_session.client(
-        "sts", region_name=region, endpoint_url=utils.sts_regional_endpoint(region)
-    ).get_caller_identity()["Account"]
+    account = _caller_account(boto_session, region)
     return "{}-{}-{}".format(CUSTOM_BUCKET_NAME_PREFIX, region, account)
 
 
-@pytest.fixture(scope="module", params=["py2", "py3"])
-def chainer_py_version(request):
-    return request.param
+@functools.lru_cache(maxsize=None)
+def _caller_account(boto_session, region):
+    return _sts_client(boto_session, region).get_caller_identity()["Account"]
+
+
+def _sts_client(boto_session, region):
+    if region not in _STS_CLIENTS:
+        _STS_CLIENTS[region] = boto_session.client(
+            "sts", region_name=region, endpoint_url=_sts_endpoint(region)
+        )
+    return _STS_CLIENTS[region]
 
 
-@pytest.fixture(scope="module", params=["py2", "py3"])
+@pytest.fixture(scope="session", params=["py2", "py3"])
 def mxnet_inference_py_version(mxnet_inference_version, request):
     if Version(mxnet_inference_version) < Version("1.7.0"):
         return request.param
@@ -226,7 +326,7 @@ def mxnet_inference_py_version(mxnet_inference_version, request):
         return "py3"
 
 
-@pytest.fixture(scope="module", params=["py2", "py3"])
+@pytest.fixture(scope="session", params=["py2", "py3"])
 def mxnet_training_py_version(mxnet_training_version, request):
     if Version(mxnet_training_version) < Version("1.7.0"):
         return request.param
@@ -238,7 +338,7 @@ def mxnet_training_py_version(mxnet_training_version, request):
         return "py3"
 
 
-@pytest.fixture(scope="module", params=["py2", "py3"])
+@pytest.fixture(scope="session", params=["py2", "py3"])
 def mxnet_eia_py_version(mxnet_eia_version, request):
     if Version(mxnet_eia_version) < Version("1.7.0"):
         return request.param
@@ -246,12 +346,12 @@ def mxnet_eia_py_version(mxnet_eia_version, request):
         return "py3"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def mxnet_eia_latest_py_version():
     return "py3"
 
 
-@pytest.fixture(scope="module", params=["py2", "py3"])
+@pytest.fixture(scope="session", params=["py2", "py3"])
 def pytorch_training_py_version(pytorch_training_version, request):
     if Version(pytorch_training_version) >= Version("2.0"):
         return "py310"
@@ -265,7 +365,7 @@ def pytorch_training_py_version(pytorch_training_version, request):
         return request.param
 
 
-@pytest.fixture(scope="module", params=["py2", "py3"])
+@pytest.fixture(scope="session", params=["py2", "py3"])
 def pytorch_inference_py_version(pytorch_inference_version, request):
     if Version(pytorch_inference_version) >= Version("2.0"):
         return "py310"
@@ -279,14 +379,14 @@ def pytorch_inference_py_version(pytorch_inference_version, request):
         return request.param
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_pytorch_training_version(huggingface_training_version):
     return _huggingface_base_fm_version(
         huggingface_training_version, "pytorch", "huggingface_training"
     )[0]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_pytorch_training_py_version(huggingface_pytorch_training_version):
     if Version(huggingface_pytorch_training_version) >= Version("2.0"):
         return "py310"
@@ -298,7 +398,7 @@ def huggingface_pytorch_training_py_version(huggingface_pytorch_training_version
         return "py36"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_training_compiler_pytorch_version(
     huggingface_training_compiler_version,
 ):
@@ -313,7 +413,7 @@ def huggingface_training_compiler_pytorch_version(
     return versions[0]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_training_compiler_tensorflow_version(
     huggingface_training_compiler_version,
 ):
@@ -328,7 +428,7 @@ def huggingface_training_compiler_tensorflow_version(
     return versions[0]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_training_compiler_tensorflow_py_version(
     huggingface_training_compiler_tensorflow_version,
 ):
@@ -339,14 +439,14 @@ def huggingface_training_compiler_tensorflow_py_version(
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_training_compiler_pytorch_py_version(
     huggingface_training_compiler_pytorch_version,
 ):
     return "py38"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_pytorch_latest_training_py_version(
     huggingface_training_pytorch_latest_version,
 ):
@@ -360,7 +460,7 @@ def huggingface_pytorch_latest_training_py_version(
         return "py36"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def pytorch_training_compiler_py_version(
     pytorch_training_compiler_version,
 ):
@@ -370,7 +470,7 @@ def pytorch_training_compiler_py_version(
 # TODO: Create a fixture to get the latest py version from TRCOMP image_uri.
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_pytorch_latest_inference_py_version(
     huggingface_inference_pytorch_latest_version,
 ):
@@ -384,12 +484,12 @@ def huggingface_pytorch_latest_inference_py_version(
         return "py36"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def graviton_tensorflow_version():
     return "2.9.1"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def graviton_pytorch_version():
     return "1.12.1"
 
@@ -414,67 +514,67 @@ def graviton_sklearn_unsupported_versions():
     return ["0.20.0", "0.23-1"]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_tensorflow_latest_training_py_version():
     return "py38"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuron_latest_inference_pytorch_version():
     return "1.9"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuronx_latest_inference_pytorch_version():
     return "1.13"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuronx_latest_training_pytorch_version():
     return "1.13"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuron_latest_inference_transformer_version():
     return "4.12"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuronx_latest_inference_transformer_version():
     return "4.36.2"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuronx_latest_training_transformer_version():
     return "4.34.1"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuron_latest_inference_py_version():
     return "py37"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuronx_latest_inference_py_version():
     return "py310"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def huggingface_neuronx_latest_training_py_version():
     return "py310"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def pytorch_neuron_version():
     return "1.11"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def pytorch_eia_py_version():
     return "py3"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def neo_pytorch_latest_py_version():
     return "py3"
 
@@ -484,24 +584,24 @@ def neo_pytorch_compilation_job_name():
     return utils.name_from_base("pytorch-neo-model")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def neo_pytorch_target_device():
     return "ml_c5"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def neo_pytorch_cpu_instance_type():
     return "ml.c5.xlarge"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def xgboost_framework_version(xgboost_version):
     if xgboost_version in ("1", "latest"):
         pytest.skip("Skipping XGBoost algorithm version.")
     return xgboost_version
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def xgboost_gpu_framework_version(xgboost_version):
     if xgboost_version in ("1", "latest"):
         pytest.skip("Skipping XGBoost algorithm version.")
@@ -510,12 +610,12 @@ def xgboost_gpu_framework_version(xgboost_version):
     return xgboost_version
 
 
-@pytest.fixture(scope="module", params=["py2", "py3"])
+@pytest.fixture(scope="session", params=["py2", "py3"])
 def tensorflow_training_py_version(tensorflow_training_version, request):
     return _tf_py_version(tensorflow_training_version, request)
 
 
-@pytest.fixture(scope="module", params=["py2", "py3"])
+@pytest.fixture(scope="session", params=["py2", "py3"])
 def tensorflow_inference_py_version(tensorflow_inference_version, request):
     version = Version(tensorflow_inference_version)
     if version == Version("1.15") or Version("1.15.4") <= version < Version("1.16"):
@@ -544,7 +644,7 @@ def _tf_py_version(tf_version, request):
     return "py310"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def tf_full_version(tensorflow_training_latest_version, tensorflow_inference_latest_version):
     """Fixture for TF tests that test both training and inference.
 
@@ -559,7 +659,7 @@ def tf_full_version(tensorflow_training_latest_version, tensorflow_inference_lat
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def tf_full_py_version(tf_full_version):
     """Fixture to match tf_full_version
 
@@ -580,41 +680,24 @@ def tf_full_py_version(tf_full_version):
     return "py310"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def pytorch_ddp_py_version():
     return "py3"
 
 
-@pytest.fixture(
-    scope="module", params=["1.10", "1.10.0", "1.10.2", "1.11", "1.11.0", "1.12", "1.12.0"]
-)
-def pytorch_ddp_framework_version(request):
-    return request.param
-
-
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def torch_distributed_py_version():
     return "py3"
 
 
-@pytest.fixture(scope="module", params=["1.11.0"])
-def torch_distributed_framework_version(request):
-    return request.param
-
-
 @pytest.fixture(scope="session")
-def cpu_instance_type(sagemaker_session, request):
-    region = sagemaker_session.boto_session.region_name
-    if region in NO_M4_REGIONS:
-        return "ml.m5.xlarge"
-    else:
-        return "ml.m4.xlarge"
+def cpu_instance_type(request):
+    return _cpu_instance_types(request.config._test_region)[0]
 
 
 @pytest.fixture(scope="session")
-def gpu_instance_type(sagemaker_session, request):
-    region = sagemaker_session.boto_session.region_name
-    if region in NO_P3_REGIONS:
+def gpu_instance_type(request):
+    if request.config._test_region in NO_P3_REGIONS:
         return "ml.p2.xlarge"
     else:
         return "ml.p3.2xlarge"
@@ -643,9 +726,8 @@ def gpu_pytorch_instance_type(sagemaker_session, request):
 
 
 @pytest.fixture(scope="session")
-def gpu_instance_type_list(sagemaker_session, request):
-    region = sagemaker_session.boto_session.region_name
-    if region in NO_P3_REGIONS:
+def gpu_instance_type_list(request):
+    if request.config._test_region in NO_P3_REGIONS:
         return ["ml.p2.xlarge"]
     else:
         return ["ml.p3.2xlarge", "ml.p2.xlarge"]
@@ -657,14 +739,13 @@ def inf_instance_type(sagemaker_session, request):
 
 
 @pytest.fixture(scope="session")
-def ec2_instance_type(cpu_instance_type):
-    return cpu_instance_type[3:]
+def ec2_instance_type(request):
+    return _cpu_instance_types(request.config._test_region)[2]
 
 
 @pytest.fixture(scope="session")
-def alternative_cpu_instance_type(sagemaker_session, request):
-    region = sagemaker_session.boto_session.region_name
-    if region in NO_T2_REGIONS:
+def alternative_cpu_instance_type(request):
+    if request.config._test_region in NO_T2_REGIONS:
         # T3 is not supported by hosting yet
         return "ml.c5.xlarge"
     else:
@@ -672,8 +753,12 @@ def alternative_cpu_instance_type(sagemaker_session, request):
 
 
 @pytest.fixture(scope="session")
-def cpu_instance_family(cpu_instance_type):
-    return "_".join(cpu_instance_type.split(".")[0:2])
+def cpu_instance_family(request):
+    return _cpu_instance_types(request.config._test_region)[1]
+
+
+def _cpu_instance_types(region):
+    return _M5 if region in NO_M4_REGIONS else _M4
 
 
 @pytest.fixture(scope="session")
@@ -683,31 +768,28 @@ def inf_instance_family(inf_instance_type):
 
 def pytest_generate_tests(metafunc):
     if "instance_type" in metafunc.fixturenames:
-        boto_config = metafunc.config.getoption("--boto-config")
-        parsed_config = json.loads(boto_config) if boto_config else {}
-        region = parsed_config.get("region_name", DEFAULT_REGION)
-        cpu_instance_type = "ml.m5.xlarge" if region in NO_M4_REGIONS else "ml.m4.xlarge"
-
-        params = [cpu_instance_type]
-        if not (
-            region in tests.integ.HOSTING_NO_P3_REGIONS
-            or region in tests.integ.TRAINING_NO_P3_REGIONS
-        ):
-            params.append("ml.p3.2xlarge")
-        elif not (
-            region in tests.integ.HOSTING_NO_P2_REGIONS
-            or region in tests.integ.TRAINING_NO_P2_REGIONS
-        ):
-            params.append("ml.p2.xlarge")
+        params = getattr(metafunc.config, "_instance_type_params", None)
+        if params is None:
+            params = _instance_type_params(metafunc.config._test_region)
+            metafunc.config._instance_type_params = params
 
         metafunc.parametrize("instance_type", params, scope="session")
 
     _generate_all_framework_version_fixtures(metafunc)
 
 
+def _instance_type_params(region):
+    params = [_cpu_instance_types(region)[0]]
+    if region not in _NO_P3:
+        params.append("ml.p3.2xlarge")
+    elif region not in _NO_P2:
+        params.append("ml.p2.xlarge")
+    return tuple(params)
+
+
 def _generate_all_framework_version_fixtures(metafunc):
     for fw in FRAMEWORKS_FOR_GENERATED_VERSION_FIXTURES:
-        config = image_uris.config_for_framework(fw.replace("_", "-"))
+        config = _framework_config(fw.replace("_", "-"))
         if "scope" in config:
             _parametrize_framework_version_fixtures(metafunc, fw, config)
         else:
@@ -724,11 +806,16 @@ def _generate_all_framework_version_fixtures(metafunc):
                 )
 
 
+@functools.lru_cache(maxsize=None)
+def _framework_config(framework):
+    return image_uris.config_for_framework(framework)
+
+
 def _huggingface_base_fm_version(huggingface_version, base_fw, fixture_prefix):
     config_name = (
         "huggingface-training-compiler" if "training_compiler" in fixture_prefix else "huggingface"
     )
-    config = image_uris.config_for_framework(config_name)
+    config = _framework_config(config_name)
     if "training" in fixture_prefix:
         hf_config = config.get("training")
     else:
@@ -763,7 +850,8 @@ def _generate_huggingface_base_fw_latest_versions(
 def _parametrize_framework_version_fixtures(metafunc, fixture_prefix, config):
     fixture_name = "{}_version".format(fixture_prefix)
     if fixture_name in metafunc.fixturenames:
-        versions = list(config["versions"].keys()) + list(config.get("version_aliases", {}).keys())
+        # An alias can repeat a concrete version (e.g. neo-tensorflow "2.9.2"), keep each once
+        versions = tuple(dict.fromkeys((*config["versions"], *config.get("version_aliases", {}))))
         metafunc.parametrize(fixture_name, versions, scope="session")
 
     latest_version = sorted(config["versions"].keys(), key=lambda v: Version(v))[-1]
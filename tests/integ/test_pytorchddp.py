@@ -19,10 +19,12 @@ import tests.integ as integ
 from sagemaker.pytorch import PyTorch
 from tests.integ import timeout
 from tests.integ.test_pytorch import _upload_training_data
+from tests.conftest import PYTORCH_DDP_FRAMEWORK_VERSIONS
 
 pytorchddp_dir = os.path.join(os.path.dirname(__file__), "..", "data", "pytorch_ddp")
 
 
+@pytest.mark.parametrize("pytorch_ddp_framework_version", PYTORCH_DDP_FRAMEWORK_VERSIONS)
 @pytest.mark.skip(
     reason="This test is skipped for now due ML capacity error."
     "This test should be re-enabled later."
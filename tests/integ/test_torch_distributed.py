@@ -19,10 +19,14 @@ import tests.integ as integ
 from sagemaker.pytorch import PyTorch
 from tests.integ import timeout
 from tests.integ.test_pytorch import _upload_training_data
+from tests.conftest import TORCH_DISTRIBUTED_FRAMEWORK_VERSIONS
 
 torch_distributed_dir = os.path.join(os.path.dirname(__file__), "..", "data", "torch_distributed")
 
 
+@pytest.mark.parametrize(
+    "torch_distributed_framework_version", TORCH_DISTRIBUTED_FRAMEWORK_VERSIONS
+)
 @pytest.mark.skip(
     reason="Disabling until the launch of SM Trainium containers"
     "This test should be re-enabled later."
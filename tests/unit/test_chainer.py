@@ -25,6 +25,7 @@ from sagemaker.chainer import defaults
 from sagemaker.chainer import Chainer
 from sagemaker.chainer import ChainerPredictor, ChainerModel
 from sagemaker.session_settings import SessionSettings
+from tests.conftest import CHAINER_PY_VERSIONS
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 SCRIPT_PATH = os.path.join(DATA_DIR, "dummy_script.py")
@@ -163,6 +164,7 @@ def _create_train_job(version, py_version):
     }
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 def test_additional_hyperparameters(sagemaker_session, chainer_version, chainer_py_version):
     chainer = _chainer_estimator(
         sagemaker_session,
@@ -182,6 +184,7 @@ def test_additional_hyperparameters(sagemaker_session, chainer_version, chainer_
     )
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 def test_attach_with_additional_hyperparameters(
     sagemaker_session, chainer_version, chainer_py_version
 ):
@@ -233,6 +236,7 @@ def test_attach_with_additional_hyperparameters(
     assert estimator.additional_mpi_options == "-x MY_ENVIRONMENT_VARIABLE"
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 @patch("sagemaker.estimator.name_from_base")
 def test_create_model(name_from_base, sagemaker_session, chainer_version, chainer_py_version):
     container_log_level = '"logging.INFO"'
@@ -271,6 +275,7 @@ def test_create_model(name_from_base, sagemaker_session, chainer_version, chaine
     name_from_base.assert_called_with(base_job_name)
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 def test_create_model_with_optional_params(sagemaker_session, chainer_version, chainer_py_version):
     container_log_level = '"logging.INFO"'
     source_dir = "s3://mybucket/source"
@@ -332,6 +337,7 @@ def test_create_model_with_custom_image(sagemaker_session):
     assert model.image_uri == custom_image
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 @patch("sagemaker.utils.create_tar_file", MagicMock())
 @patch("time.time", return_value=TIME)
 @patch("time.strftime", return_value=TIMESTAMP)
@@ -382,6 +388,7 @@ def test_chainer(strftime, time, sagemaker_session, chainer_version, chainer_py_
     assert isinstance(predictor, ChainerPredictor)
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 @patch("sagemaker.utils.create_tar_file", MagicMock())
 def test_model(sagemaker_session, chainer_version, chainer_py_version):
     model = ChainerModel(
@@ -396,6 +403,7 @@ def test_model(sagemaker_session, chainer_version, chainer_py_version):
     assert isinstance(predictor, ChainerPredictor)
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 @patch("sagemaker.utils.create_tar_file", MagicMock())
 def test_model_custom_serialization(sagemaker_session, chainer_version, chainer_py_version):
     model = ChainerModel(
@@ -419,6 +427,7 @@ def test_model_custom_serialization(sagemaker_session, chainer_version, chainer_
     assert predictor.deserializer is custom_deserializer
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 @patch("sagemaker.fw_utils.tar_and_upload_dir", MagicMock())
 def test_model_prepare_container_def_accelerator_error(
     sagemaker_session, chainer_version, chainer_py_version
@@ -435,6 +444,7 @@ def test_model_prepare_container_def_accelerator_error(
         model.prepare_container_def(INSTANCE_TYPE, accelerator_type=ACCELERATOR_TYPE)
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 def test_model_prepare_container_def_no_instance_type_or_image(chainer_version, chainer_py_version):
     model = ChainerModel(
         MODEL_DATA,
@@ -451,6 +461,7 @@ def test_model_prepare_container_def_no_instance_type_or_image(chainer_version,
     assert expected_msg in str(e)
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 def test_training_image_default(sagemaker_session, chainer_version, chainer_py_version):
     chainer = Chainer(
         entry_point=SCRIPT_PATH,
@@ -467,6 +478,7 @@ def test_training_image_default(sagemaker_session, chainer_version, chainer_py_v
     )
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 def test_attach(sagemaker_session, chainer_version, chainer_py_version):
     training_image = "1.dkr.ecr.us-west-2.amazonaws.com/sagemaker-chainer:{}-cpu-{}".format(
         chainer_version, chainer_py_version
@@ -616,6 +628,7 @@ def test_model_py2_warning(warning, sagemaker_session, chainer_version):
     warning.assert_called_with(model._framework_name, defaults.LATEST_PY2_VERSION)
 
 
+@pytest.mark.parametrize("chainer_py_version", CHAINER_PY_VERSIONS)
 @patch("sagemaker.utils.create_tar_file", MagicMock())
 def test_register_chainer_model_auto_infer_framework(
     sagemaker_session, chainer_version, chainer_py_version
@@ -24,6 +24,7 @@ from sagemaker.pytorch import defaults
 from sagemaker.pytorch import PyTorch, PyTorchPredictor, PyTorchModel
 from sagemaker.instance_group import InstanceGroup
 from sagemaker.session_settings import SessionSettings
+from tests.conftest import PYTORCH_DDP_FRAMEWORK_VERSIONS
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 SCRIPT_PATH = os.path.join(DATA_DIR, "dummy_script.py")
@@ -785,6 +786,7 @@ def test_register_pytorch_model_auto_infer_framework(
     )
 
 
+@pytest.mark.parametrize("pytorch_ddp_framework_version", PYTORCH_DDP_FRAMEWORK_VERSIONS)
 def test_pytorch_ddp_distribution_configuration(
     sagemaker_session, pytorch_ddp_framework_version, pytorch_ddp_py_version
 ):